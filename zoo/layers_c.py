@@ -33,6 +33,25 @@ import random
 import math
 import sys
 
+# NHWC is the fast path for tensor-core convolutions; make it explicit so no
+# hidden layout transposes get inserted around the conv layers.
+tf.keras.backend.set_image_data_format('channels_last')
+
+# decorator for the preprocessing layers' call methods: one XLA-fused trace
+# reused across input shapes. reduce_retracing first appeared in TF 2.9; older
+# releases fall back to a single relaxed-shape trace via an input signature.
+try:
+    _preprocess_function = tf.function(jit_compile=True, reduce_retracing=True)
+except TypeError:
+    try:
+        _preprocess_function = tf.function(
+            jit_compile=True,
+            input_signature=[tf.TensorSpec(shape=[None, None, None, None], dtype=tf.float32)])
+    except TypeError:
+        # older TF without jit_compile support
+        _preprocess_function = tf.function(
+            input_signature=[tf.TensorSpec(shape=[None, None, None, None], dtype=tf.float32)])
+
 class Layers(object):
     ''' Layers class for Composable Models '''
 
@@ -40,13 +59,21 @@ class Layers(object):
     reg          = None         # kernel regularizer
     relu         = None         # ReLU max value
     bias         = True         # whether to use bias in dense/conv layers
- 
-    def __init__(self, init_weights, reg, relu, bias):
+    mixed_precision = False     # whether to train with mixed precision (fp16 compute)
+    layout       = 'channels_last' # conv layout: channels_last, channels_first or auto
+    C_t          = 32           # channel threshold for layout selection when auto
+
+    # common batch norm configuration; fused=True forces the single-kernel
+    # FusedBatchNormV3 path and fails fast if the layer config disqualifies it
+    bn_params    = {'epsilon': 1.001e-5, 'fused': True}
+
+    def __init__(self, init_weights, reg, relu, bias, mixed_precision=False):
         """ Constructor
-            init_weights : kernel initializer
-            reg          : kernel regularizer
-            relu         : clip value for ReLU
-            bias         : whether to use bias
+            init_weights   : kernel initializer
+            reg            : kernel regularizer
+            relu           : clip value for ReLU
+            bias           : whether to use bias
+            mixed_precision: whether to use mixed (fp16) precision policy
         """
         if init_weights is not None:
             self.init_weights = init_weights
@@ -56,6 +83,112 @@ class Layers(object):
             self.relu = relu
         if bias is not None:
             self.bias = bias
+        if mixed_precision:
+            # fp16 compute / fp32 variables: conv/matmul dispatch to tensor cores
+            self.mixed_precision = True
+            tf.keras.mixed_precision.set_global_policy('mixed_float16')
+
+        # layers added via top() awaiting materialization into the model
+        self._top_layers = []
+
+        # whether the classifier outputs log-probabilities (log_probs=True)
+        self._log_probs = False
+
+        # resolve the initializer/regularizer specs to objects once so each
+        # layer does not construct a fresh object from a string/float
+        self._init_obj = tf.keras.initializers.get(self.init_weights)
+        self._reg_obj  = tf.keras.regularizers.get(self.reg) if self.reg is not None else None
+
+        # resolved once; the layer wrappers consult this instead of re-parsing
+        # their kwargs on every construction call
+        self._defaults = {'reg': self._reg_obj, 'init_weights': self._init_obj, 'bias': self.bias}
+
+    def _resolve(self, hyperparameters):
+        """ Resolve per-layer hyperparameter overrides against the cached defaults
+            hyperparameters : per-layer overrides
+        """
+        defaults = self._defaults
+        return (hyperparameters.get('reg', defaults['reg']),
+                hyperparameters.get('init_weights', defaults['init_weights']),
+                hyperparameters.get('bias', defaults['bias']))
+
+    @staticmethod
+    def _tensor_format(x):
+        """ Layout of a tensor as tagged by the wrappers that produced it;
+            tensors from outside the wrappers are assumed channels_last
+            x : the tensor
+        """
+        return getattr(x, '_layout', 'channels_last')
+
+    @staticmethod
+    def _tag_format(x, data_format):
+        """ Record a tensor's layout for the downstream wrappers
+            x          : the tensor
+            data_format: the layout it was produced in
+        """
+        if data_format == 'channels_first':
+            x._layout = data_format
+        return x
+
+    def _data_format(self, x):
+        """ Pick the data format for the next conv layer.
+            'auto' is only safe for graphs built exclusively from these
+            wrappers: raw Keras layers (MaxPooling2D, Add, Concatenate, ...)
+            are layout-unaware and drop the tag, so convert to channels_last
+            with _convert_layout before handing a tensor to one.
+            x : input to the layer
+        """
+        if self.layout != 'auto':
+            return self.layout
+        # narrow-channel layers (e.g., the 3-channel stem input) prefer NCHW,
+        # wide-channel layers prefer the NHWC tensor-core kernels
+        if self._tensor_format(x) == 'channels_first':
+            channels = x.shape[1]
+        else:
+            channels = x.shape[-1]
+        if channels is not None and channels < self.C_t:
+            return 'channels_first'
+        return 'channels_last'
+
+    def _convert_layout(self, x, data_format):
+        """ Transpose only when the tensor's layout disagrees with the next layer
+            x          : input tensor
+            data_format: the layout required by the next layer
+        """
+        if data_format != self._tensor_format(x):
+            if data_format == 'channels_first':
+                x = layers.Permute((3, 1, 2))(x)
+            else:
+                x = layers.Permute((2, 3, 1))(x)
+        return self._tag_format(x, data_format)
+
+    def wrap_optimizer(self, optimizer):
+        """ Wrap the optimizer with dynamic loss scaling for mixed precision
+            optimizer : the optimizer to wrap
+        """
+        if self.mixed_precision:
+            optimizer = tf.keras.mixed_precision.LossScaleOptimizer(optimizer)
+        return optimizer
+
+    @staticmethod
+    def make_dataset(x, y, batch_size=32, augment_fn=None, mixed_precision=False):
+        """ Construct a tf.data input pipeline (replacement for ImageDataGenerator)
+            x              : input images (NHWC)
+            y              : labels
+            batch_size     : batch size
+            augment_fn     : per-batch augmentation function
+            mixed_precision: normalize and cast to fp16 in the pipeline
+        """
+        dataset = tf.data.Dataset.from_tensor_slices((x, y))
+        dataset = dataset.shuffle(len(x)).batch(batch_size)
+        if mixed_precision:
+            # normalize here in fp16 so the Normalize layer can be dropped and
+            # the input tensor moves at half the bytes
+            dataset = dataset.map(lambda _x, _y: (tf.cast(_x, tf.float16) * (1.0 / 255.0), _y),
+                                  num_parallel_calls=tf.data.AUTOTUNE)
+        if augment_fn is not None:
+            dataset = dataset.map(augment_fn, num_parallel_calls=tf.data.AUTOTUNE)
+        return dataset.prefetch(tf.data.AUTOTUNE)
 
     def prestem(self, inputs, **metaparameters):
       """ Construct a Pre-stem for Stem Group
@@ -63,58 +196,58 @@ class Layers(object):
           norm   : include normalization layer
       """
       x = inputs
-      if 'norm' in metaparameters:
-          norm = metaparameters['norm']
-          if norm:
-              x = self.Normalize(inputs)
+      if metaparameters.get('norm', False):
+          x = self.Normalize()(inputs)
       return x
 
-    def stem(self, inputs, kernel_size=(7, 7), **metaparameters):
+    def stem(self, inputs, n_filters=64, kernel_size=(7, 7), **metaparameters):
       """ Construct the Stem Group
           inputs     : input to the stem
+          n_filters  : number of filters
           kernel_size: kernel (filter) size
           pooling    : pooling option
       """
-      if 'pooling' in metaparameters:
-          pooling = metaparameters['pooling']
-      else:
-          pooling = None
+      pooling = metaparameters.get('pooling', None)
 
-      x = self.Conv2D(inputs, kernel_size, strides=(1, 1), padding='same')
-      x = self.BatchNormalization(x)
-      x = self.ReLU(x)
+      x = self.ConvBNReLU(inputs, n_filters, kernel_size, strides=(1, 1), padding='same')
 
       if pooling == 'max':
+          # raw Keras layers are layout-unaware; ensure NHWC first
+          x = self._convert_layout(x, 'channels_last')
           x = MaxPooling2D((2, 2), strides=2)(x)
       elif pooling == 'feature':
           # feature pooling
-          x = self.Conv2D(x, kernel_size, strides=(2, 2), padding='same')
-          x = self.BatchNormalization(x)
-          x = self.ReLU(x)
+          x = self.ConvBNReLU(x, n_filters, kernel_size, strides=(2, 2), padding='same')
       return x
 
-    def classifier(self, x, n_classes, **metaparameters):
-      """ Construct the Classifier Group 
-          x         : input to the classifier
-          n_classes : number of output classes
-          pooling   : type of feature map pooling
-          dropout   : hidden dropout unit
+    def classifier(self, x, n_classes, include_softmax=True, log_probs=False, **metaparameters):
+      """ Construct the Classifier Group
+          x              : input to the classifier
+          n_classes      : number of output classes
+          include_softmax: include the softmax layer; when False the model
+                           outputs logits and the loss must use from_logits=True
+          log_probs      : output fp32 log-probabilities instead of a softmax
+                           (stable under fp16); compile() then trains with nll_loss
+          pooling        : type of feature map pooling
+          dropout        : hidden dropout unit
       """
-      if 'pooling' in metaparameters:
-          pooling = metaparameters['pooling']
-      else:
-          pooling = GlobalAveragePooling2D
-      if 'dropout' in metaparameters:
-          dropout = metaparameters['dropout']
-      else:
-          dropout = None
+      pooling = metaparameters.get('pooling', GlobalAveragePooling2D)
+      dropout = metaparameters.get('dropout', None)
 
       if pooling is not None:
+          # pooling and the dense layer expect NHWC
+          x = self._convert_layout(x, 'channels_last')
+
           # Save the encoding layer (high dimensionality)
           self.encoding = x
 
           # Pooling at the end of all the convolutional groups
-          x = pooling()(x)
+          if pooling == GlobalAveragePooling2D:
+              # raw reduction over H, W: XLA fuses it into the preceding
+              # conv's epilogue instead of dispatching a separate pooling kernel
+              x = tf.reduce_mean(x, axis=[1, 2])
+          else:
+              x = pooling()(x)
 
           # Save the embedding layer (low dimensionality)
           self.embedding = x
@@ -125,23 +258,66 @@ class Layers(object):
       # Final Dense Outputting Layer for the outputs
       x = self.Dense(x, n_classes, use_bias=True, **metaparameters)
       
+      if self.mixed_precision:
+          # bring the logits back to fp32 -- softmax/crossentropy are unstable in fp16
+          x = Activation('linear', dtype='float32')(x)
+
       # Save the pre-activation probabilities layer
       self.probabilities = x
-      outputs = Activation('softmax')(x)
+
+      if not include_softmax:
+          # output the logits; the softmax is computed (fused and numerically
+          # stable) inside a from_logits=True crossentropy loss instead
+          self.softmax = tf.nn.softmax(x)
+          return x
+
+      if log_probs:
+          # fp16 softmax overflows easily; output fp32 log-probabilities and
+          # train against them with nll_loss (selected by compile())
+          outputs = tf.nn.log_softmax(x, axis=-1)
+          # the softmax attribute still exposes the probabilities
+          self.softmax = tf.nn.softmax(x)
+          self._log_probs = True
+          return outputs
+
+      # softmax is kept in fp32 regardless of the compute policy
+      outputs = Activation('softmax', dtype='float32')(x)
       # Save the post-activation probabilities layer
       self.softmax = outputs
       return outputs
 
+    @staticmethod
+    def nll_loss(y_true, y_pred):
+        """ Negative log-likelihood loss over the log-probabilities output by
+            the classifier under mixed precision
+            y_true : one-hot ground truth
+            y_pred : log-probabilities
+        """
+        return -tf.reduce_sum(y_true * y_pred, axis=-1)
+
     def top(self, layer):
         """ Add layer to the top of the neural network
             layer : layer to add
         """
-        outputs = layer(self._model.outputs)
+        # defer the Model rebuild: rebuilding per added layer re-walks the
+        # whole graph, which is quadratic when layers are stacked one by one
+        self._top_layers.append(layer)
+
+    def _materialize_top(self):
+        """ Apply any deferred top layers and rebuild the model once
+        """
+        if not self._top_layers:
+            return
+        outputs = self._model.outputs
+        for layer in self._top_layers:
+            outputs = layer(outputs)
         self._model = Model(self._model.inputs, outputs)
+        self._top_layers = []
 
     def summary(self):
         """ Call underlying summary method
         """
+        self._materialize_top()
         self._model.summary()
 
     def Dense(self, x, units, activation=None, use_bias=True, **hyperparameters):
@@ -152,15 +328,8 @@ class Layers(object):
             init_weights: kernel initializer
             reg         : kernel regularizer
         """
-        if 'reg' in hyperparameters:
-            reg = hyperparameters['reg']
-        else:
-            reg = self.reg
-        if 'init_weights' in hyperparameters:
-            init_weights = hyperparameters['init_weights']
-        else:
-            init_weights = self.init_weights
-            
+        reg, init_weights, _ = self._resolve(hyperparameters)
+
         x = Dense(units, activation, use_bias=use_bias,
                   kernel_initializer=init_weights, kernel_regularizer=reg)(x)
         return x
@@ -177,21 +346,15 @@ class Layers(object):
             init_weights: kernel initializer
             reg         : kernel regularizer
         """
-        if 'reg' in hyperparameters:
-            reg = hyperparameters['reg']
-        else:
-            reg = self.reg
-        if 'init_weights' in hyperparameters:
-            init_weights = hyperparameters['init_weights']
-        else:
-            init_weights = self.init_weights
-        if 'bias' in hyperparameters:
-            bias = hyperparameters['bias']
-        else:
-            bias = self.bias
+        reg, init_weights, bias = self._resolve(hyperparameters)
+
+        data_format = self._data_format(x)
+        x = self._convert_layout(x, data_format)
 
         x = Conv2D(n_filters, kernel_size, strides=strides, padding=padding, activation=activation,
+                   data_format=data_format,
                    use_bias=bias, kernel_initializer=init_weights, kernel_regularizer=reg)(x)
+        x = self._tag_format(x, data_format)
         return x
 
     def Conv2DTranspose(self, x, n_filters, kernel_size, strides=(1, 1), padding='valid', activation=None, **hyperparameters):
@@ -206,20 +369,11 @@ class Layers(object):
             init_weights: kernel initializer
             reg         : kernel regularizer
         """
-        if 'reg' in hyperparameters:
-            reg = hyperparameters['reg']
-        else:
-            reg = self.reg
-        if 'init_weights' in hyperparameters:
-            init_weights = hyperparameters['init_weights']
-        else:
-            init_weights = self.init_weights 
-        if 'bias' in hyperparameters:
-            bias = hyperparameters['bias']
-        else:
-            bias = self.bias
+        reg, init_weights, bias = self._resolve(hyperparameters)
 
-        x = Conv2DTranspose(n_filters, kernel_size, strides=strides, padding=padding, activation=activation, 
+        x = self._convert_layout(x, 'channels_last')
+        x = Conv2DTranspose(n_filters, kernel_size, strides=strides, padding=padding, activation=activation,
+			    data_format='channels_last',
 			    use_bias=bias, kernel_initializer=init_weights, kernel_regularizer=reg)(x)
         return x
 
@@ -234,20 +388,13 @@ class Layers(object):
             init_weights: kernel initializer
             reg         : kernel regularizer
         """
-        if 'reg' in hyperparameters:
-            reg = hyperparameters['reg']
-        else:
-            reg = self.reg
-        if 'init_weights' in hyperparameters:
-            init_weights = hyperparameters['init_weights']
-        else:
-            init_weights = self.init_weights
-        if 'bias' in hyperparameters:
-            bias = hyperparameters['bias']
-        else:
-            bias = self.bias
+        reg, init_weights, bias = self._resolve(hyperparameters)
 
-        x = DepthwiseConv2D(kernel_size, strides=strides, padding=padding, activation=activation, 
+        x = self._convert_layout(x, 'channels_last')
+        # channels_last + fp16 (mixed precision) is what dispatches the fast
+        # cuDNN depthwise kernels for 1x1/3x3; fp32 has no fast path
+        x = DepthwiseConv2D(kernel_size, strides=strides, padding=padding, activation=activation,
+			    data_format='channels_last',
 			    use_bias=bias, kernel_initializer=init_weights, kernel_regularizer=reg)(x)
         return x
 
@@ -263,20 +410,11 @@ class Layers(object):
             init_weights: kernel initializer
             reg         : kernel regularizer
         """
-        if 'reg' in hyperparameters:
-            reg = hyperparameters['reg']
-        else:
-            reg = self.reg
-        if 'init_weights' in hyperparameters:
-            init_weights = hyperparameters['init_weights']
-        else:
-            init_weights = self.init_weights
-        if 'bias' in hyperparameters:
-            bias = hyperparameters['bias']
-        else:
-            bias = self.bias
+        reg, init_weights, bias = self._resolve(hyperparameters)
 
+        x = self._convert_layout(x, 'channels_last')
         x = SeparableConv2D(n_filters, kernel_size, strides=strides, padding=padding, activation=activation,
+                            data_format='channels_last',
                             use_bias=bias, kernel_initializer=init_weights, kernel_regularizer=reg)(x)
 
         return x
@@ -285,60 +423,244 @@ class Layers(object):
         """ Construct ReLU activation function
             x  : input to activation function
         """
+        data_format = self._tensor_format(x)
         x = ReLU(self.relu)(x)
-        return x
+        return self._tag_format(x, data_format)
 	
     def HS(self, x):
         """ Construct Hard Swish activation function
             x  : input to activation function
         """
-        return (x * K.relu(x + 3, max_value=6.0)) / 6.0
+        # use the built-in fused op (TF 2.9+), else a form XLA fuses into a
+        # single elementwise kernel under the model-level jit compilation
+        if hasattr(tf.keras.activations, 'hard_swish'):
+            return tf.keras.activations.hard_swish(x)
+        return x * tf.nn.relu6(x + 3.0) * 0.16666667
 
     def BatchNormalization(self, x, **params):
         """ Construct a Batch Normalization function
             x : input to function
         """
-        x = BatchNormalization(epsilon=1.001e-5, **params)(x)
+        params = {**self.bn_params, **params}
+        if params.get('fused') and len(x.shape) != 4:
+            # the fused kernel requires a 4D input; auto-select for e.g. the
+            # 2D dense outputs normalized in the autoencoder
+            params['fused'] = None
+        data_format = self._tensor_format(x)
+        if 'axis' not in params:
+            # follow the layout of the incoming tensor
+            params['axis'] = 1 if data_format == 'channels_first' else -1
+        x = BatchNormalization(**params)(x)
+        return self._tag_format(x, data_format)
+
+    def ConvBNReLU(self, x, n_filters, kernel_size, strides=(1, 1), padding='same', **hyperparameters):
+        """ Construct a Conv2D - BatchNorm - ReLU block
+            x           : input to block
+            n_filters   : number of filters
+            kernel_size : kernel (filter) size
+            strides     : strides
+            padding     : how to pad when filter overlaps the edge
+        """
+        # the bias is redundant with the following batch normalization
+        hyperparameters['bias'] = False
+        x = self.Conv2D(x, n_filters, kernel_size, strides=strides, padding=padding, **hyperparameters)
+        x = self.BatchNormalization(x)
+        x = self.ReLU(x)
         return x
 
+    def fold_preprocessing(self):
+        """ Fold the Normalize/Standarize affine transform into the first
+            convolution for inference export: the conv kernel is scaled by
+            1/std and its bias shifted by -mean/std, then the model is rebuilt
+            with the preprocessing layer replaced by the identity so no
+            per-batch preprocessing kernel remains.
+            Folds only into a convolution that directly consumes the
+            preprocessing output; anything that cannot be folded (no such
+            conv, or a shift with a bias-less conv) is left in place.
+            Note: folding a nonzero shift through a padding='same' conv
+            changes border numerics - the zero padding was never shifted,
+            but the folded bias applies everywhere.
+        """
+        _layers = self._model.layers
+        folded  = []
+        for pre in _layers:
+            if isinstance(pre, Layers.Normalize):
+                scale, shift = pre._inv_max.numpy(), np.float32(0.0)
+            elif isinstance(pre, Layers.Standarize):
+                scale, shift = pre._inv_std.numpy(), pre._neg_mean_over_std.numpy()
+            else:
+                continue
+            # the fold is only valid for a conv directly consuming the
+            # preprocessing output
+            conv = next((l for l in _layers
+                         if isinstance(l, Conv2D) and getattr(l, 'input', None) is pre.output), None)
+            if conv is None:
+                continue
+            # broadcast per-channel constants along the kernel's input-channel axis
+            if np.ndim(scale) >= 1:
+                scale = np.reshape(scale, (1, 1, -1, 1))
+            if np.ndim(shift) >= 1:
+                shift = np.reshape(shift, (1, 1, -1, 1))
+
+            weights = conv.get_weights()
+            bias_delta = np.sum(weights[0] * shift, axis=(0, 1, 2))
+            kernel = weights[0] * scale
+            if conv.use_bias:
+                conv.set_weights([kernel, weights[1] + bias_delta])
+            elif not np.any(bias_delta):
+                conv.set_weights([kernel])
+            else:
+                # cannot absorb the shift without a bias term (e.g., the
+                # bias-less ConvBNReLU stem); keep this preprocessing layer
+                continue
+            folded.append(pre)
+
+        if not folded:
+            return
+
+        # rebuild the graph with only the folded preprocessing as the identity
+        def _strip(layer):
+            if layer in folded:
+                return Activation('linear', name=layer.name)
+            return layer.__class__.from_config(layer.get_config())
+
+        weights = {layer.name: layer.get_weights() for layer in _layers}
+        model = tf.keras.models.clone_model(self._model, clone_function=_strip)
+        for layer in model.layers:
+            w = weights.get(layer.name)
+            if w:
+                layer.set_weights(w)
+        self._model = model
+
+    def quantize(self, calibration_ds):
+        """ Quantize the model to INT8 for deployed inference
+            calibration_ds : representative input batches for calibration
+        """
+        model = self._model
+        try:
+            # quantization-aware wrapping of the conv/dense layers when available
+            import tensorflow_model_optimization as tfmot
+            model = tfmot.quantization.keras.quantize_model(model)
+        except ImportError:
+            # fall back to post-training quantization only
+            pass
+        except (ValueError, RuntimeError) as e:
+            # tfmot rejects layers it does not support (e.g., the custom
+            # preprocessing layers); fall back to post-training quantization
+            print("*** quantize: QAT wrapping failed, falling back to PTQ:", e)
+            model = self._model
+
+        def representative_dataset():
+            for batch in calibration_ds:
+                yield [tf.cast(batch, tf.float32)]
+
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_types = [tf.int8]
+        return converter.convert()
+
+    def fold_bn_into_conv(self):
+        """ Fold batch normalization into the preceding convolution for inference.
+            The conv weights are rewritten as W' = W * gamma / sqrt(var + eps) and
+            b' = beta + (b - mean) * gamma / sqrt(var + eps); the batch norm is
+            then reset to the identity so the graph optimizer can elide it.
+        """
+        for bn in self._model.layers:
+            if not isinstance(bn, BatchNormalization):
+                continue
+            # pair via graph connectivity - model.layers is depth-sorted, so
+            # list adjacency pairs the wrong conv/BN in branchy models
+            layer = bn.input._keras_history.layer
+            if not isinstance(layer, Conv2D):
+                continue
+            gamma, beta, mean, var = bn.get_weights()
+            scale = gamma / np.sqrt(var + bn.epsilon)
+
+            weights = layer.get_weights()
+            if isinstance(layer, DepthwiseConv2D):
+                # depthwise kernels are (kh, kw, channels, multiplier) - align
+                # the per-output-channel scale with the last two axes
+                kscale = np.reshape(scale, (1, 1) + tuple(weights[0].shape[2:]))
+            else:
+                kscale = scale
+            kernel  = weights[0] * kscale
+            if layer.use_bias:
+                bias = beta + (weights[1] - mean) * scale
+                layer.set_weights([kernel, bias])
+                # reset the batch norm to the identity
+                bn.set_weights([np.ones_like(gamma), np.zeros_like(beta),
+                                np.zeros_like(mean), np.ones_like(var) - bn.epsilon])
+            else:
+                # no conv bias to fold the shift into - leave it in the batch norm
+                layer.set_weights([kernel])
+                bn.set_weights([np.ones_like(gamma), beta - mean * scale,
+                                np.zeros_like(mean), np.ones_like(var) - bn.epsilon])
+
     ###
     # Pre-stem Layers
     ###
 
     class Normalize(layers.Layer):
         """ Custom Layer for Preprocessing Input - Normalization """
-        def __init__(self, max=255.0, **parameters):
+        def __init__(self, max=255.0, out_dtype=None, **parameters):
             """ Constructor """
-            super(Composable.Normalize, self).__init__(**parameters)
+            super(Layers.Normalize, self).__init__(**parameters)
             self.max = max
-    
+            # output dtype override (e.g., bfloat16); defaults to the policy's
+            # compute dtype so fp16 flows straight into the first conv
+            self.out_dtype = out_dtype
+            # multiply by the reciprocal - FDIV is far slower than FMUL on GPU
+            self._inv_max = tf.constant(1.0 / max, dtype=tf.float32)
+
         def build(self, input_shape):
             """ Handler for Build (Functional) or Compile (Sequential) operation """
             self.kernel = None # no learnable parameters
-    
-        @tf.function
+
+        @_preprocess_function
         def call(self, inputs):
             """ Handler for run-time invocation of layer """
-            inputs = inputs / self.max
-            return inputs
+            # match the input dtype - Keras feeds fp16 under a mixed precision policy
+            inputs = inputs * tf.cast(self._inv_max, inputs.dtype)
+            return tf.cast(inputs, self.out_dtype or self.compute_dtype)
+
+        def get_config(self):
+            """ Handler for layer configuration serialization """
+            config = super(Layers.Normalize, self).get_config()
+            config.update({'max': self.max, 'out_dtype': self.out_dtype})
+            return config
 
     class Standarize(layers.Layer):
         """ Custom Layer for Preprocessing Input - Standardization """
-        def __init__(self, mean, std, **parameters):
+        def __init__(self, mean, std, out_dtype=None, **parameters):
             """ Constructor """
-            super(Composable.Standardize, self).__init__(**parameters)
+            super(Layers.Standarize, self).__init__(**parameters)
             self.mean = mean
             self.std  = std
+            # output dtype override (e.g., bfloat16); defaults to the policy's
+            # compute dtype so fp16 flows straight into the first conv
+            self.out_dtype = out_dtype
+            # fused multiply-add form: x * (1/std) + (-mean/std)
+            self._inv_std = tf.constant(1.0 / std, dtype=tf.float32)
+            self._neg_mean_over_std = tf.constant(-mean / std, dtype=tf.float32)
 
         def build(self, input_shape):
             """ Handler for Build (Functional) or Compile (Sequential) operation """
             self.kernel = None # no learnable parameters
 
-        @tf.function
+        @_preprocess_function
         def call(self, inputs):
             """ Handler for run-time invocation of layer """
-            inputs = (inputs - self.mean) / self.std
-            return inputs
+            # match the input dtype - Keras feeds fp16 under a mixed precision policy
+            inputs = (inputs * tf.cast(self._inv_std, inputs.dtype)
+                      + tf.cast(self._neg_mean_over_std, inputs.dtype))
+            return tf.cast(inputs, self.out_dtype or self.compute_dtype)
+
+        def get_config(self):
+            """ Handler for layer configuration serialization """
+            config = super(Layers.Standarize, self).get_config()
+            config.update({'mean': self.mean, 'std': self.std, 'out_dtype': self.out_dtype})
+            return config
 
  
 
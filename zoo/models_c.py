@@ -66,6 +66,8 @@ class Composable(Layers, Preprocess, Pretraining, HyperTune):
 
     @property
     def model(self):
+        # apply any layers still pending from top()
+        self._materialize_top()
         return self._model
 
     @model.setter
@@ -100,13 +102,25 @@ class Composable(Layers, Preprocess, Pretraining, HyperTune):
     # Training
     ###
 
-    def compile(self, loss='categorical_crossentropy', optimizer=Adam(lr=0.001, decay=1e-5), metrics=['acc']):
+    def compile(self, loss='categorical_crossentropy', optimizer=Adam(lr=0.001, decay=1e-5), metrics=['acc'],
+                xla=True):
         """ Compile the model for training
             loss     : the loss function
             optimizer: the optimizer
             metrics  : metrics to report
+            xla      : whether to compile the train/predict steps with XLA
         """
-        self.model.compile(loss=loss, optimizer=optimizer, metrics=metrics)
+        # apply any layers still pending from top()
+        self._materialize_top()
+        if self._log_probs and loss == 'categorical_crossentropy':
+            # the classifier outputs log-probabilities; categorical
+            # crossentropy over log-probs is numerically wrong
+            loss = self.nll_loss
+        try:
+            self.model.compile(loss=loss, optimizer=optimizer, metrics=metrics, jit_compile=xla)
+        except TypeError:
+            # older TF without jit_compile support in compile()
+            self.model.compile(loss=loss, optimizer=optimizer, metrics=metrics)
 
     # training variables
     hidden_dropout = None # hidden dropout in classifier
@@ -218,6 +232,7 @@ class Composable(Layers, Preprocess, Pretraining, HyperTune):
     def evaluate(self, x_test, y_test):
         """ Call underlying evaluate() method
         """
+        self._materialize_top()
         return self._model.evaluate(x_test, y_test)
 
     def cifar10(self, epochs=10, decay=('cosine', 0)):